@@ -194,6 +194,20 @@ class MultiplexerTestCase(ToriiTestSuiteCase):
 		):
 			self.dut.add(elem, addr = 0x10000)
 
+	def test_shadow_unbalanced(self):
+		dut = Multiplexer(addr_width = 16, data_width = 8, shadow_overlaps = 0)
+		# The 16-bit register at 0x5 uses shadow chunks 0x4 and 0x5, and the 8-bit register at 0x4
+		# uses shadow chunk 0x4, regardless of the size of the shadow.
+		elem_8b  = Element( 8, 'rw')
+		elem_16b = Element(16, 'rw')
+		dut.add(elem_8b,  addr = 0x4)
+		dut.add(elem_16b, addr = 0x5)
+		with self.assertRaisesRegex(
+			ValueError,
+			r'^Shadow register r_shadow cannot be balanced to satisfy an overlap constraint of 0$'
+		):
+			Fragment.get(dut, platform = None)
+
 	def test_sim(self):
 		for shadow_overlaps in [None, 0, 1]:
 			with self.subTest(shadow_overlaps = shadow_overlaps):
@@ -465,3 +479,38 @@ class DecoderTestCase(ToriiTestSuiteCase):
 		sim.add_sync_process(sim_test)
 		with sim.write_vcd('test.vcd'):
 			sim.run()
+
+	def test_sim_single_sub(self):
+		dut  = Decoder(addr_width = 10, data_width = 8)
+		mux  = Multiplexer(addr_width = 10, data_width = 8)
+		elem = Element(8, 'rw')
+		mux.add(elem, addr = 2)
+		dut.add(mux.bus)
+
+		elem_addr = dut.bus.memory_map.find_resource(elem).start
+		self.assertEqual(elem_addr, 0x002)
+
+		bus = dut.bus
+
+		def sim_test():
+			yield bus.addr.eq(elem_addr)
+			yield bus.w_stb.eq(1)
+			yield bus.w_data.eq(0x55)
+			yield
+			yield bus.w_stb.eq(0)
+			yield
+			self.assertEqual((yield elem.w_data), 0x55)
+
+			yield elem.r_data.eq(0xaa)
+			yield bus.r_stb.eq(1)
+			yield
+			yield bus.r_stb.eq(0)
+			yield
+			self.assertEqual((yield bus.r_data), 0xaa)
+
+		m = Module()
+		m.submodules += dut, mux
+		sim = Simulator(m)
+		sim.add_clock(1e-6)
+		sim.add_sync_process(sim_test)
+		sim.run()
@@ -151,93 +151,87 @@ class WishboneCSRBridgeTestCase(ToriiTestSuiteCase):
 			sim.run()
 
 	def test_wide(self):
-		mux = csr.Multiplexer(addr_width = 10, data_width = 8)
-		reg = MockRegister(32, name = 'reg')
-		mux.add(reg.element)
-		dut = WishboneCSRBridge(mux.bus, data_width = 32)
-
-		def sim_test():
-			yield dut.wb_bus.cyc.eq(1)
-			yield dut.wb_bus.adr.eq(0)
-
-			yield dut.wb_bus.we.eq(1)
-
-			yield dut.wb_bus.dat_w.eq(0x44332211)
-			yield dut.wb_bus.sel.eq(0b1111)
-			yield dut.wb_bus.stb.eq(1)
-			yield
-			yield
-			yield
-			yield
-			yield
-			yield
-			self.assertEqual((yield dut.wb_bus.ack), 1)
-			yield dut.wb_bus.stb.eq(0)
-			yield
-			self.assertEqual((yield dut.wb_bus.ack), 0)
-			self.assertEqual((yield reg.r_count), 0)
-			self.assertEqual((yield reg.w_count), 1)
-			self.assertEqual((yield reg.data), 0x44332211)
-
-			# partial write
-			yield dut.wb_bus.dat_w.eq(0xaabbccdd)
-			yield dut.wb_bus.sel.eq(0b0110)
-			yield dut.wb_bus.stb.eq(1)
-			yield
-			yield
-			yield
-			yield
-			yield
-			yield
-			self.assertEqual((yield dut.wb_bus.ack), 1)
-			yield dut.wb_bus.stb.eq(0)
-			yield
-			self.assertEqual((yield dut.wb_bus.ack), 0)
-			self.assertEqual((yield reg.r_count), 0)
-			self.assertEqual((yield reg.w_count), 1)
-			self.assertEqual((yield reg.data), 0x44332211)
-
-			yield dut.wb_bus.we.eq(0)
-
-			yield dut.wb_bus.sel.eq(0b1111)
-			yield dut.wb_bus.stb.eq(1)
-			yield
-			yield
-			yield
-			yield
-			yield
-			yield
-			self.assertEqual((yield dut.wb_bus.ack), 1)
-			self.assertEqual((yield dut.wb_bus.dat_r), 0x44332211)
-			yield dut.wb_bus.stb.eq(0)
-			yield
-			self.assertEqual((yield dut.wb_bus.ack), 0)
-			self.assertEqual((yield reg.r_count), 1)
-			self.assertEqual((yield reg.w_count), 1)
-
-			yield reg.data.eq(0xaaaaaaaa)
-
-			# partial read
-			yield dut.wb_bus.sel.eq(0b0110)
-			yield dut.wb_bus.stb.eq(1)
-			yield
-			yield
-			yield
-			yield
-			yield
-			yield
-			self.assertEqual((yield dut.wb_bus.ack), 1)
-			self.assertEqual((yield dut.wb_bus.dat_r), 0x00332200)
-			yield dut.wb_bus.stb.eq(0)
-			yield
-			self.assertEqual((yield dut.wb_bus.ack), 0)
-			self.assertEqual((yield reg.r_count), 1)
-			self.assertEqual((yield reg.w_count), 1)
-
-		m = Module()
-		m.submodules += mux, reg, dut
-		sim = Simulator(m)
-		sim.add_clock(1e-6)
-		sim.add_sync_process(sim_test)
-		with sim.write_vcd('test.vcd'):
-			sim.run()
+		for register_strobes in [False, True]:
+			with self.subTest(register_strobes = register_strobes):
+				mux = csr.Multiplexer(addr_width = 10, data_width = 8)
+				reg = MockRegister(32, name = 'reg')
+				mux.add(reg.element)
+				dut = WishboneCSRBridge(mux.bus, data_width = 32, register_strobes = register_strobes)
+
+				# One cycle per segment plus one to re-register the read data, and one more when the
+				# strobes are registered.
+				latency = 4 + 1 + register_strobes
+
+				def wait_ack():
+					for _ in range(latency):
+						yield
+						self.assertEqual((yield dut.wb_bus.ack), 0)
+					yield
+					self.assertEqual((yield dut.wb_bus.ack), 1)
+
+				def sim_test():
+					yield dut.wb_bus.cyc.eq(1)
+					yield dut.wb_bus.adr.eq(0)
+
+					yield dut.wb_bus.we.eq(1)
+
+					yield dut.wb_bus.dat_w.eq(0x44332211)
+					yield dut.wb_bus.sel.eq(0b1111)
+					yield dut.wb_bus.stb.eq(1)
+					yield from wait_ack()
+					# Write side effects occur simultaneously with acknowledgement.
+					self.assertEqual((yield reg.w_count), 1)
+					self.assertEqual((yield reg.data), 0x44332211)
+					yield dut.wb_bus.stb.eq(0)
+					yield
+					self.assertEqual((yield dut.wb_bus.ack), 0)
+					self.assertEqual((yield reg.r_count), 0)
+					self.assertEqual((yield reg.w_count), 1)
+					self.assertEqual((yield reg.data), 0x44332211)
+
+					# partial write
+					yield dut.wb_bus.dat_w.eq(0xaabbccdd)
+					yield dut.wb_bus.sel.eq(0b0110)
+					yield dut.wb_bus.stb.eq(1)
+					yield from wait_ack()
+					self.assertEqual((yield reg.w_count), 1)
+					self.assertEqual((yield reg.data), 0x44332211)
+					yield dut.wb_bus.stb.eq(0)
+					yield
+					self.assertEqual((yield dut.wb_bus.ack), 0)
+					self.assertEqual((yield reg.r_count), 0)
+					self.assertEqual((yield reg.w_count), 1)
+					self.assertEqual((yield reg.data), 0x44332211)
+
+					yield dut.wb_bus.we.eq(0)
+
+					yield dut.wb_bus.sel.eq(0b1111)
+					yield dut.wb_bus.stb.eq(1)
+					yield from wait_ack()
+					self.assertEqual((yield dut.wb_bus.dat_r), 0x44332211)
+					yield dut.wb_bus.stb.eq(0)
+					yield
+					self.assertEqual((yield dut.wb_bus.ack), 0)
+					self.assertEqual((yield reg.r_count), 1)
+					self.assertEqual((yield reg.w_count), 1)
+
+					yield reg.data.eq(0xaaaaaaaa)
+
+					# partial read
+					yield dut.wb_bus.sel.eq(0b0110)
+					yield dut.wb_bus.stb.eq(1)
+					yield from wait_ack()
+					self.assertEqual((yield dut.wb_bus.dat_r), 0x00332200)
+					yield dut.wb_bus.stb.eq(0)
+					yield
+					self.assertEqual((yield dut.wb_bus.ack), 0)
+					self.assertEqual((yield reg.r_count), 1)
+					self.assertEqual((yield reg.w_count), 1)
+
+				m = Module()
+				m.submodules += mux, reg, dut
+				sim = Simulator(m)
+				sim.add_clock(1e-6)
+				sim.add_sync_process(sim_test)
+				with sim.write_vcd('test.vcd'):
+					sim.run()
@@ -136,6 +136,20 @@ class EventMapTestCase(ToriiTestSuiteCase):
 			(src_1, 1),
 		])
 
+	def test_sources_by_trigger(self):
+		src_0 = Source(trigger = 'rise')
+		src_1 = Source(trigger = 'level')
+		src_2 = Source(trigger = 'rise')
+		event_map = EventMap()
+		event_map.add(src_0)
+		event_map.add(src_1)
+		event_map.add(src_2)
+		self.assertEqual(event_map.sources_by_trigger('rise'), ((src_0, 0), (src_2, 2)))
+		event_map.freeze()
+		self.assertEqual(event_map.sources_by_trigger(Source.Trigger.RISE), ((src_0, 0), (src_2, 2)))
+		self.assertEqual(event_map.sources_by_trigger(Source.Trigger.LEVEL), ((src_1, 1),))
+		self.assertEqual(event_map.sources_by_trigger(Source.Trigger.FALL), ())
+
 
 class MonitorTestCase(ToriiTestSuiteCase):
 	def test_simple(self):
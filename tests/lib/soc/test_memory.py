@@ -11,19 +11,29 @@ class RangeMapTestCase(ToriiTestSuiteCase):
 		range_map.insert(range(20, 21), 'c')
 		range_map.insert(range(15, 16), 'b')
 		range_map.insert(range(16, 20), 'q')
-		self.assertEqual(range_map._keys, [
+		self.assertEqual([key for key, _ in range_map.items()], [
 			range(0, 10), range(15, 16), range(16, 20), range(20, 21)
 		])
 
 	def test_overlaps(self):
 		range_map = _RangeMap()
 		range_map.insert(range(10, 20), 'a')
-		self.assertEqual(range_map.overlaps(range(5, 15)), ['a'])
-		self.assertEqual(range_map.overlaps(range(15, 25)), ['a'])
-		self.assertEqual(range_map.overlaps(range(5, 25)), ['a'])
-		self.assertEqual(range_map.overlaps(range(0, 3)), [])
-		self.assertEqual(range_map.overlaps(range(0, 5)), [])
-		self.assertEqual(range_map.overlaps(range(25, 30)), [])
+		self.assertTrue(range_map.overlaps(range(5, 15)))
+		self.assertTrue(range_map.overlaps(range(15, 25)))
+		self.assertTrue(range_map.overlaps(range(5, 25)))
+		self.assertFalse(range_map.overlaps(range(0, 3)))
+		self.assertFalse(range_map.overlaps(range(0, 5)))
+		self.assertFalse(range_map.overlaps(range(25, 30)))
+
+	def test_overlap_values(self):
+		range_map = _RangeMap()
+		range_map.insert(range(10, 20), 'a')
+		range_map.insert(range(20, 30), 'b')
+		self.assertEqual(range_map.overlap_values(range(5, 15)), ['a'])
+		self.assertEqual(range_map.overlap_values(range(15, 25)), ['a', 'b'])
+		self.assertEqual(range_map.overlap_values(range(25, 35)), ['b'])
+		self.assertEqual(range_map.overlap_values(range(0, 10)), [])
+		self.assertEqual(range_map.overlap_values(range(30, 35)), [])
 
 	def test_insert_wrong_overlap(self):
 		range_map = _RangeMap()
@@ -42,6 +52,11 @@ class RangeMapTestCase(ToriiTestSuiteCase):
 		self.assertEqual(range_map.get(10), 'a')
 		self.assertEqual(range_map.get(14), 'a')
 		self.assertEqual(range_map.get(15), None)
+		range_map.insert(range(15, 20), 'b')
+		self.assertEqual(range_map.get(15), 'b')
+		self.assertEqual(range_map.get(14), 'a')
+		self.assertEqual(range_map.get(19), 'b')
+		self.assertEqual(range_map.get(20), None)
 
 
 class ResourceInfoTestCase(ToriiTestSuiteCase):
@@ -562,6 +577,20 @@ class MemoryMapDiscoveryTestCase(ToriiTestSuiteCase):
 			self.assertEqual(other.end,   res_info.end)
 			self.assertEqual(other.width, res_info.width)
 
+	def test_frozen_cached(self):
+		self.root.freeze()
+		res_info = list(self.root.all_resources())
+		self.assertEqual(list(self.root.all_resources()), res_info)
+		for info in res_info:
+			other = self.root.find_resource(info.resource)
+			self.assertIs(self.root.find_resource(info.resource), other)
+			self.assertEqual(other.name,  info.name)
+			self.assertEqual(other.start, info.start)
+			self.assertEqual(other.end,   info.end)
+			self.assertEqual(other.width, info.width)
+		with self.assertRaises(KeyError):
+			self.root.find_resource('resNA')
+
 	def test_find_resource_wrong(self):
 		with self.assertRaises(KeyError) as error:
 			self.root.find_resource('resNA')
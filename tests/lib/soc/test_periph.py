@@ -1,5 +1,7 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
+import copy
+from enum                 import IntEnum
 
 from torii.lib.soc.periph import *
 from torii.lib.soc.memory import MemoryMap
@@ -18,6 +20,12 @@ class ConstantBoolTestCase(ToriiTestSuiteCase):
 		with self.assertRaisesRegex(TypeError, r'Value must be a bool, not \'foo\''):
 			ConstantBool('foo')
 
+	def test_shared(self):
+		self.assertIs(ConstantBool(True), ConstantBool(True))
+		self.assertIs(ConstantBool(False), ConstantBool(False))
+		self.assertIsNot(ConstantBool(True), ConstantBool(False))
+		self.assertIs(copy.deepcopy(ConstantBool(True)), ConstantBool(True))
+
 	def test_repr(self):
 		self.assertEqual(repr(ConstantBool(True)), 'ConstantBool(True)')
 
@@ -71,6 +79,13 @@ class ConstantMapTestCase(ToriiTestSuiteCase):
 			'(\'C\', ConstantBool(False))])',
 		)
 
+	def test_init_int_subclass(self):
+		class Mode(IntEnum):
+			FAST = 6
+
+		constant_map = ConstantMap(MODE = Mode.FAST)
+		self.assertEqual(repr(constant_map), 'ConstantMap([(\'MODE\', ConstantInt(6, width=3, signed=False))])')
+
 	def test_init_wrong_value(self):
 		with self.assertRaisesRegex(
 			TypeError,
@@ -8,7 +8,7 @@ from ..           import Elaboratable, Memory, Module, Mux, ResetSignal, Signal
 from .formal      import Assert, Assume, Initial
 from ..util.units import log2_ceil
 from .cdc         import AsyncFFSynchronizer, FFSynchronizer
-from .coding.gray import Decoder, Encoder
+from .coding.gray import Decoder
 
 __all__ = (
 	'AsyncFIFO',
@@ -157,8 +157,8 @@ class SyncFIFO(Elaboratable, FIFOInterface):
 		w_port = storage.write_port()
 		r_port = storage.read_port(
 			domain = 'comb' if self.fwft else 'sync', transparent = self.fwft)
-		produce = Signal(range(self.depth))
-		consume = Signal(range(self.depth))
+		produce = Signal(range(self.depth), name = 'produce')
+		consume = Signal(range(self.depth), name = 'consume')
 
 		m.d.comb += [
 			w_port.addr.eq(produce),
@@ -350,53 +350,51 @@ class AsyncFIFO(Elaboratable, FIFOInterface):
 		do_read  = self.r_rdy & self.r_en
 
 		# TODO: extract this pattern into lib.cdc.GrayCounter
-		produce_w_bin = Signal(self._ctr_bits)
-		produce_w_nxt = Signal(self._ctr_bits)
+		# The next binary value of each counter is Gray encoded directly into the counter's
+		# Gray register, there is no need for a separate encoder between the adder and it.
+		produce_w_bin = Signal(self._ctr_bits, name = 'produce_w_bin')
+		produce_w_nxt = Signal(self._ctr_bits, name = 'produce_w_nxt')
 		m.d.comb += produce_w_nxt.eq(produce_w_bin + do_write)
 		m.d[self._w_domain] += produce_w_bin.eq(produce_w_nxt)
 
 		# Note: Both read-domain counters must be reset_less (see comments below)
-		consume_r_bin = Signal(self._ctr_bits, reset_less = True)
-		consume_r_nxt = Signal(self._ctr_bits)
+		consume_r_bin = Signal(self._ctr_bits, reset_less = True, name = 'consume_r_bin')
+		consume_r_nxt = Signal(self._ctr_bits, name = 'consume_r_nxt')
 		m.d.comb += consume_r_nxt.eq(consume_r_bin + do_read)
 		m.d[self._r_domain] += consume_r_bin.eq(consume_r_nxt)
 
-		produce_w_gry = Signal(self._ctr_bits)
-		produce_r_gry = Signal(self._ctr_bits)
-		produce_enc = m.submodules.produce_enc = Encoder(self._ctr_bits)
+		produce_w_gry = Signal(self._ctr_bits, name = 'produce_w_gry')
+		produce_r_gry = Signal(self._ctr_bits, name = 'produce_r_gry')
 		produce_cdc = m.submodules.produce_cdc = FFSynchronizer(  # noqa: F841
 			produce_w_gry, produce_r_gry, o_domain = self._r_domain
 		)
-		m.d.comb += produce_enc.i.eq(produce_w_nxt),
-		m.d[self._w_domain] += produce_w_gry.eq(produce_enc.o)
+		m.d[self._w_domain] += produce_w_gry.eq(produce_w_nxt ^ produce_w_nxt[1:])
 
-		consume_r_gry = Signal(self._ctr_bits, reset_less = True)
-		consume_w_gry = Signal(self._ctr_bits)
-		consume_enc = m.submodules.consume_enc = Encoder(self._ctr_bits)
+		consume_r_gry = Signal(self._ctr_bits, reset_less = True, name = 'consume_r_gry')
+		consume_w_gry = Signal(self._ctr_bits, name = 'consume_w_gry')
 		consume_cdc = m.submodules.consume_cdc = FFSynchronizer(  # noqa: F841
 			consume_r_gry, consume_w_gry, o_domain = self._w_domain
 		)
-		m.d.comb += consume_enc.i.eq(consume_r_nxt)
-		m.d[self._r_domain] += consume_r_gry.eq(consume_enc.o)
+		m.d[self._r_domain] += consume_r_gry.eq(consume_r_nxt ^ consume_r_nxt[1:])
 
-		consume_w_bin = Signal(self._ctr_bits)
+		consume_w_bin = Signal(self._ctr_bits, name = 'consume_w_bin')
 		consume_dec = m.submodules.consume_dec = Decoder(self._ctr_bits)
 		m.d.comb += consume_dec.i.eq(consume_w_gry),
 		m.d[self._w_domain] += consume_w_bin.eq(consume_dec.o)
 
-		produce_r_bin = Signal(self._ctr_bits)
+		produce_r_bin = Signal(self._ctr_bits, name = 'produce_r_bin')
 		produce_dec = m.submodules.produce_dec = Decoder(self._ctr_bits)
 		m.d.comb += produce_dec.i.eq(produce_r_gry),
 		m.d.comb += produce_r_bin.eq(produce_dec.o)
 
-		w_full  = Signal()
-		r_empty = Signal()
+		# The queue is full when the two Gray code counters differ in exactly their two
+		# most significant bits, compute the difference once and pick the bits from that.
+		w_gry_diff = produce_w_gry ^ consume_w_gry
+
+		w_full  = Signal(name = 'w_full')
+		r_empty = Signal(name = 'r_empty')
 		m.d.comb += [
-			w_full.eq(
-				(produce_w_gry[-1]  != consume_w_gry[-1]) &
-				(produce_w_gry[-2]  != consume_w_gry[-2]) &
-				(produce_w_gry[:-2] == consume_w_gry[:-2])
-			),
+			w_full.eq(w_gry_diff[-1] & w_gry_diff[-2] & (w_gry_diff[:-2] == 0)),
 			r_empty.eq(consume_r_gry == produce_r_gry),
 		]
 
@@ -433,19 +431,17 @@ class AsyncFIFO(Elaboratable, FIFOInterface):
 		# reset through another mechanism. See https://github.com/amaranth-lang/amaranth/issues/181
 		# for the full discussion.
 		w_rst = ResetSignal(domain = self._w_domain, allow_reset_less = True)
-		r_rst = Signal()
+		r_rst = Signal(name = 'r_rst')
 
 		# Async-set-sync-release synchronizer avoids CDC hazards
 		rst_cdc = m.submodules.rst_cdc = AsyncFFSynchronizer(w_rst, r_rst, o_domain = self._r_domain)  # noqa: F841
 
-		# Decode Gray code counter synchronized from write domain to overwrite binary
-		# counter in read domain.
-		rst_dec = m.submodules.rst_dec = Decoder(self._ctr_bits)
-		m.d.comb += rst_dec.i.eq(produce_r_gry)
+		# Use the already decoded Gray code counter synchronized from write domain to
+		# overwrite binary counter in read domain.
 		with m.If(r_rst):
 			m.d.comb += r_empty.eq(1)
 			m.d[self._r_domain] += consume_r_gry.eq(produce_r_gry)
-			m.d[self._r_domain] += consume_r_bin.eq(rst_dec.o)
+			m.d[self._r_domain] += consume_r_bin.eq(produce_r_bin)
 			m.d[self._r_domain] += self.r_rst.eq(1)
 		with m.Else():
 			m.d[self._r_domain] += self.r_rst.eq(0)
@@ -531,11 +527,11 @@ class AsyncFIFOBuffered(Elaboratable, FIFOInterface):
 			fifo.w_en.eq(self.w_en),
 		]
 
-		r_consume_buffered = Signal()
+		r_consume_buffered = Signal(name = 'r_consume_buffered')
 		m.d.comb += r_consume_buffered.eq((self.r_rdy - self.r_en) & self.r_rdy)
 		m.d[self._r_domain] += self.r_level.eq(fifo.r_level + r_consume_buffered)
 
-		w_consume_buffered = Signal()
+		w_consume_buffered = Signal(name = 'w_consume_buffered')
 		m.submodules.consume_buffered_cdc = FFSynchronizer(
 			r_consume_buffered, w_consume_buffered, o_domain = self._w_domain, stages = 4
 		)
@@ -1,6 +1,5 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
-from collections    import defaultdict
 from enum           import Enum
 from typing         import Optional
 
@@ -15,6 +14,20 @@ __all__ = (
 	'Multiplexer',
 )
 
+def _or_tree(terms: list):
+	'''
+	OR together ``terms`` as a balanced tree instead of a linear chain, keeping the depth of the
+	resulting expression logarithmic in the number of terms.
+	'''
+
+	if len(terms) == 0:
+		return 0
+	if len(terms) == 1:
+		return terms[0]
+	half = len(terms) // 2
+	return _or_tree(terms[:half]) | _or_tree(terms[half:])
+
+
 class Element(Record):
 	class Access(Enum):
 		'''
@@ -29,11 +42,15 @@ class Element(Record):
 		W  = 'w'
 		RW = 'rw'
 
+		def __init__(self, value) -> None:
+			self._readable = 'r' in value
+			self._writable = 'w' in value
+
 		def readable(self) -> bool:
-			return self == self.R or self == self.RW
+			return self._readable
 
 		def writable(self) -> bool:
-			return self == self.W or self == self.RW
+			return self._writable
 
 	'''
 	Peripheral-side CSR interface.
@@ -187,6 +204,8 @@ class Multiplexer(Elaboratable):
 	class _Shadow:
 		class Chunk:
 			'''The interface between a CSR multiplexer and a shadow register chunk.'''
+			__slots__ = ('name', 'data', 'r_en', 'w_en', '_elements')
+
 			def __init__(self, shadow, offset, elements):
 				self.name = f'{shadow.name}__{offset}'
 				self.data = Signal(shadow.granularity, name = f'{self.name}__data')
@@ -195,7 +214,10 @@ class Multiplexer(Elaboratable):
 				self._elements = tuple(elements)
 
 			def elements(self):
-				'''Iterate the address ranges of CSR elements using this chunk.'''
+				'''
+				Iterate the CSR elements using this chunk, as ``(chunk_addr, elem_range)`` pairs, where
+				``chunk_addr`` is the bus address in ``elem_range`` that uses this chunk.
+				'''
 				yield from self._elements
 
 		'''
@@ -211,6 +233,8 @@ class Multiplexer(Elaboratable):
 			Maximum number of CSR elements that can share a chunk of the shadow register. Optional.
 			If ``None``, it is implicitly set by :meth:`Multiplexer._Shadow.prepare`.
 		'''
+		__slots__ = ('name', 'granularity', 'overlaps', '_ranges', '_elem_sizes', '_size', '_chunks')
+
 		def __init__(self, granularity, overlaps, *, name):
 			assert isinstance(name, str)
 			assert isinstance(granularity, int) and granularity >= 0
@@ -219,6 +243,7 @@ class Multiplexer(Elaboratable):
 			self.granularity = granularity
 			self.overlaps    = overlaps
 			self._ranges     = set()
+			self._elem_sizes = dict()
 			self._size       = 1
 			self._chunks     = None
 
@@ -246,9 +271,9 @@ class Multiplexer(Elaboratable):
 				elem_range.start)`` chunks of the shadow register. If this amount is greater than
 				:attr:`~Multiplexer._Shadow.size`, it replaces the latter.
 			'''
-			assert isinstance(elem_range, range)
 			self._ranges.add(elem_range)
 			elem_size  = 2 ** log2_ceil(elem_range.stop - elem_range.start)
+			self._elem_sizes[elem_range] = elem_size
 			self._size = max(self._size, elem_size)
 
 		def decode_address(self, addr, elem_range):
@@ -291,7 +316,7 @@ class Multiplexer(Elaboratable):
 				The decoded offset would therefore be ``8`` (i.e. ``0b1000``).
 			''' # noqa: E101
 			assert elem_range in self._ranges and addr in elem_range
-			elem_size = 2 ** log2_ceil(elem_range.stop - elem_range.start)
+			elem_size = self._elem_sizes[elem_range]
 			self_mask = self.size - 1
 			elem_mask = elem_size - 1
 			return elem_range.start & self_mask & ~elem_mask | addr & elem_mask
@@ -307,7 +332,7 @@ class Multiplexer(Elaboratable):
 				located at ``offset``. See :meth:`~Multiplexer._Shadow.decode_address` for details.
 			'''
 			assert elem_range in self._ranges and isinstance(offset, int)
-			elem_size = 2 ** log2_ceil(elem_range.stop - elem_range.start)
+			elem_size = self._elem_sizes[elem_range]
 			return elem_range.start + ((offset - elem_range.start) % elem_size)
 
 		def prepare(self):
@@ -324,38 +349,64 @@ class Multiplexer(Elaboratable):
 			of the shadow is doubled. This increases the number of address bits used for decoding,
 			which effectively balances chunk usage across the shadow register.
 
-			This method is recursive until the overlap constraint is satisfied.
+			The size is doubled until the overlap constraint is satisfied. If the size of the shadow
+			already spans the start address of every element and the constraint is still not met,
+			no amount of doubling can satisfy it, and a :exc:`ValueError` is raised.
 			'''
 			if isinstance(self._ranges, frozenset):
 				return
 			if self.overlaps is None:
 				self.overlaps = len(self._ranges)
 
-			elements = defaultdict(list)
-			balanced = True
-
-			for elem_range in self._ranges:
-				for chunk_addr in elem_range:
-					chunk_offset = self.decode_address(chunk_addr, elem_range)
-					if len(elements[chunk_offset]) > self.overlaps:
-						balanced = False
+			max_start = max((elem_range.start for elem_range in self._ranges), default = 0)
+			overlaps  = self.overlaps
+			elements  = dict()
+
+			while True:
+				balanced  = True
+				self_mask = self.size - 1
+
+				for elem_range in self._ranges:
+					# Equivalent to calling decode_address() on every address of the range, with the
+					# bits taken from the start of the range only computed once.
+					elem_mask  = self._elem_sizes[elem_range] - 1
+					range_bits = elem_range.start & self_mask & ~elem_mask
+					for chunk_addr in elem_range:
+						chunk_offset   = range_bits | chunk_addr & elem_mask
+						chunk_elements = elements.get(chunk_offset)
+						if chunk_elements is None:
+							elements[chunk_offset] = [(chunk_addr, elem_range)]
+						elif len(chunk_elements) > overlaps:
+							balanced = False
+							break
+						else:
+							chunk_elements.append((chunk_addr, elem_range))
+					if not balanced:
 						break
-					elements[chunk_offset].append(elem_range)
-
-			if balanced:
-				self._ranges = frozenset(self._ranges)
-				self._chunks = dict()
-				for chunk_offset, chunk_elements in elements.items():
-					chunk = Multiplexer._Shadow.Chunk(self, chunk_offset, chunk_elements)
-					self._chunks[chunk_offset] = chunk
-			else:
+
+				if balanced:
+					break
+
+				if self._size > max_start:
+					raise ValueError(
+						f'Shadow register {self.name} cannot be balanced to satisfy an overlap '
+						f'constraint of {self.overlaps}'
+					)
+
 				self._size *= 2
-				self.prepare()
+				elements.clear()
+
+			self._ranges = frozenset(self._ranges)
+			self._chunks = dict()
+			for chunk_offset, chunk_elements in elements.items():
+				chunk = Multiplexer._Shadow.Chunk(self, chunk_offset, chunk_elements)
+				self._chunks[chunk_offset] = chunk
 
 		def chunks(self):
-			'''Iterate shadow register chunks used by at least one CSR element.'''
-			for chunk_offset, chunk in self._chunks.items():
-				yield chunk_offset, chunk
+			'''Shadow register chunks used by at least one CSR element, as ``(offset, chunk)`` pairs.'''
+			if self._chunks is None:
+				return ()
+			return self._chunks.items()
 
 	'''
 	CSR register multiplexer.
@@ -430,6 +481,7 @@ class Multiplexer(Elaboratable):
 			addr_width = addr_width, data_width = data_width,
 			alignment = alignment, name = name
 		)
+		self._data_width = data_width
 		self._bus = None
 		self._r_shadow = Multiplexer._Shadow(data_width, shadow_overlaps, name = 'r_shadow')
 		self._w_shadow = Multiplexer._Shadow(data_width, shadow_overlaps, name = 'w_shadow')
@@ -470,17 +522,18 @@ class Multiplexer(Elaboratable):
 		if not isinstance(element, Element):
 			raise TypeError(f'Element must be an instance of csr.Element, not {element!r}')
 
-		size = (element.width + self._map.data_width - 1) // self._map.data_width
+		size = -(-element.width // self._data_width)
 		return self._map.add_resource(
 			element, size = size, addr = addr, alignment = alignment,
 			extend = extend, name = element.name
 		)
 
 	def elaborate(self, platform) -> Module:
-		m = Module()
+		elems = dict()
 
 		for elem, _, (elem_start, elem_end) in self._map.resources():
 			elem_range = range(elem_start, elem_end)
+			elems[elem_range] = elem
 			if elem.access.readable():
 				self._r_shadow.add(elem_range)
 			if elem.access.writable():
@@ -489,66 +542,87 @@ class Multiplexer(Elaboratable):
 		self._r_shadow.prepare()
 		self._w_shadow.prepare()
 
+		m = Module()
+
+		bus        = self.bus
+		data_width = bus.data_width
+		addr       = bus.addr
+		r_stb      = bus.r_stb
+		w_stb      = bus.w_stb
+		w_data     = bus.w_data
+
 		# Instead of a straightforward multiplexer for reads, use a per-element address comparator,
 		# AND the shadow register chunk with the comparator output, and OR all of those together.
 		# If the toolchain doesn't already synthesize multiplexer trees this way, this trick can
 		# save a significant amount of logic, since e.g. one 4-LUT can pack one 2-MUX, but two
 		# 2-AND or 2-OR gates.
-		r_data_fanin = 0
+		r_data_fanin = []
+		# The bus address ranges of the elements are disjoint, so every address selects at most
+		# one chunk of each shadow register, and all of the chunks can share a single switch.
+		r_cases = []
 
 		for chunk_offset, r_chunk, in self._r_shadow.chunks():
 			# Use the same trick to select which element is read into a shadow register chunk.
-			r_chunk_w_en_fanin = 0
-			r_chunk_data_fanin = 0
-
-			m.d.sync += r_chunk.r_en.eq(0)
+			r_chunk_w_en_fanin = []
+			r_chunk_data_fanin = []
+			r_chunk_addr_match = []
 
-			with m.Switch(self.bus.addr):
-				for elem_range in r_chunk.elements():
-					chunk_addr  = self._r_shadow.encode_offset(chunk_offset, elem_range)
-					elem        = self._map.decode_address(elem_range.start)
-					elem_offset = chunk_addr - elem_range.start
-					elem_slice  = elem.r_data.word_select(elem_offset, self.bus.data_width)
+			for chunk_addr, elem_range in r_chunk.elements():
+				elem        = elems[elem_range]
+				elem_offset = chunk_addr - elem_range.start
+				elem_slice  = elem.r_data.word_select(elem_offset, data_width)
 
-					with m.Case(chunk_addr):
-						if chunk_addr == elem_range.start:
-							m.d.comb += elem.r_stb.eq(self.bus.r_stb)
-						# Delay by 1 cycle, allowing reads to be pipelined.
-						m.d.sync += r_chunk.r_en.eq(self.bus.r_stb)
+				if chunk_addr == elem_range.start:
+					r_cases.append((chunk_addr, elem))
+				r_chunk_addr_match.append(addr == chunk_addr)
 
-					r_chunk_w_en_fanin |= elem.r_stb
-					r_chunk_data_fanin |= Mux(elem.r_stb, elem_slice, 0)
+				r_chunk_w_en_fanin.append(elem.r_stb)
+				r_chunk_data_fanin.append(Mux(elem.r_stb, elem_slice, 0))
 
-			m.d.comb += r_chunk.w_en.eq(r_chunk_w_en_fanin)
+			# Delay by 1 cycle, allowing reads to be pipelined.
+			m.d.sync += r_chunk.r_en.eq(r_stb & _or_tree(r_chunk_addr_match))
+			m.d.comb += r_chunk.w_en.eq(_or_tree(r_chunk_w_en_fanin))
 			with m.If(r_chunk.w_en):
-				m.d.sync += r_chunk.data.eq(r_chunk_data_fanin)
+				m.d.sync += r_chunk.data.eq(_or_tree(r_chunk_data_fanin))
 
-			r_data_fanin |= Mux(r_chunk.r_en, r_chunk.data, 0)
+			r_data_fanin.append(Mux(r_chunk.r_en, r_chunk.data, 0))
 
-		m.d.comb += self.bus.r_data.eq(r_data_fanin)
+		m.d.comb += bus.r_data.eq(_or_tree(r_data_fanin))
 
-		for chunk_offset, w_chunk in self._w_shadow.chunks():
-			with m.Switch(self.bus.addr):
-				for elem_range in w_chunk.elements():
-					chunk_addr  = self._w_shadow.encode_offset(chunk_offset, elem_range)
-					elem        = self._map.decode_address(elem_range.start)
-					elem_offset = chunk_addr - elem_range.start
-					elem_slice  = elem.w_data.word_select(elem_offset, self.bus.data_width)
+		with m.Switch(addr):
+			for chunk_addr, elem in r_cases:
+				with m.Case(chunk_addr):
+					m.d.comb += elem.r_stb.eq(r_stb)
 
-					if chunk_addr == elem_range.stop - 1:
-						m.d.sync += elem.w_stb.eq(0)
+		w_cases = []
 
-					with m.Case(chunk_addr):
-						if chunk_addr == elem_range.stop - 1:
-							# Delay by 1 cycle, avoiding combinatorial paths through
-							# the CSR bus and into CSR registers.
-							m.d.sync += elem.w_stb.eq(self.bus.w_stb)
-						m.d.comb += w_chunk.w_en.eq(self.bus.w_stb)
+		for chunk_offset, w_chunk in self._w_shadow.chunks():
+			for chunk_addr, elem_range in w_chunk.elements():
+				elem        = elems[elem_range]
+				elem_offset = chunk_addr - elem_range.start
+				elem_slice  = elem.w_data.word_select(elem_offset, data_width)
+
+				# Only a write to the last chunk of an element strobes the element, so only that chunk
+				# carries the strobe of the element along with it.
+				if chunk_addr == elem_range.stop - 1:
+					m.d.sync += elem.w_stb.eq(0)
+					w_cases.append((chunk_addr, w_chunk, elem))
+				else:
+					w_cases.append((chunk_addr, w_chunk, None))
 
-					m.d.comb += elem_slice.eq(w_chunk.data)
+				m.d.comb += elem_slice.eq(w_chunk.data)
 
 			with m.If(w_chunk.w_en):
-				m.d.sync += w_chunk.data.eq(self.bus.w_data)
+				m.d.sync += w_chunk.data.eq(w_data)
+
+		with m.Switch(addr):
+			for chunk_addr, w_chunk, last_elem in w_cases:
+				with m.Case(chunk_addr):
+					if last_elem is not None:
+						# Delay by 1 cycle, avoiding combinatorial paths through
+						# the CSR bus and into CSR registers.
+						m.d.sync += last_elem.w_stb.eq(w_stb)
+					m.d.comb += w_chunk.w_en.eq(w_stb)
 
 		return m
 
@@ -645,26 +719,52 @@ class Decoder(Elaboratable):
 	def elaborate(self, platform) -> Module:
 		m = Module()
 
+		bus    = self.bus
+		addr   = bus.addr
+		r_stb  = bus.r_stb
+		w_stb  = bus.w_stb
+		w_data = bus.w_data
+
+		window_patterns = list(self._map.window_patterns())
+		if len(window_patterns) == 1 and window_patterns[0][1] == ('-' * bus.addr_width, 1):
+			# A single subordinate bus spanning the whole address space is selected by every
+			# address, so it can be connected directly without decoding the address.
+			sub_map, _ = window_patterns[0]
+			sub_bus    = self._subs[sub_map]
+			m.d.comb += [
+				sub_bus.addr.eq(addr[:sub_bus.addr_width]),
+				sub_bus.r_stb.eq(r_stb),
+				sub_bus.w_stb.eq(w_stb),
+				sub_bus.w_data.eq(w_data),
+				bus.r_data.eq(sub_bus.r_data),
+			]
+			return m
+
 		# See Multiplexer.elaborate above.
-		r_data_fanin = 0
+		r_data_fanin = []
+		sub_cases    = []
 
-		with m.Switch(self.bus.addr):
-			for sub_map, (sub_pat, sub_ratio) in self._map.window_patterns():
-				if sub_ratio != 1:
-					raise ValueError(f'sub_ratio must be exactly 1, not {sub_ratio}')
+		for sub_map, (sub_pat, sub_ratio) in window_patterns:
+			if sub_ratio != 1:
+				raise ValueError(f'sub_ratio must be exactly 1, not {sub_ratio}')
 
-				sub_bus = self._subs[sub_map]
-				m.d.comb += sub_bus.addr.eq(self.bus.addr[:sub_bus.addr_width])
+			sub_bus = self._subs[sub_map]
+			m.d.comb += [
+				sub_bus.addr.eq(addr[:sub_bus.addr_width]),
+				sub_bus.w_data.eq(w_data),
+			]
 
-				# The CSR bus interface is defined to output zero when idle, allowing us to avoid
-				# adding a multiplexer here.
-				r_data_fanin |= sub_bus.r_data
-				m.d.comb += sub_bus.w_data.eq(self.bus.w_data)
+			# The CSR bus interface is defined to output zero when idle, allowing us to avoid
+			# adding a multiplexer here.
+			r_data_fanin.append(sub_bus.r_data)
+			sub_cases.append((sub_pat, sub_bus))
 
+		with m.Switch(addr):
+			for sub_pat, sub_bus in sub_cases:
 				with m.Case(sub_pat):
-					m.d.comb += sub_bus.r_stb.eq(self.bus.r_stb)
-					m.d.comb += sub_bus.w_stb.eq(self.bus.w_stb)
+					m.d.comb += sub_bus.r_stb.eq(r_stb)
+					m.d.comb += sub_bus.w_stb.eq(w_stb)
 
-		m.d.comb += self.bus.r_data.eq(r_data_fanin)
+		m.d.comb += bus.r_data.eq(_or_tree(r_data_fanin))
 
 		return m
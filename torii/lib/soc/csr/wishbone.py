@@ -2,7 +2,7 @@
 
 from typing         import Optional
 
-from ....           import Cat, Elaboratable, Module, Signal
+from ....           import Array, Cat, Elaboratable, Module, Signal
 from ....util.units import log2_exact
 from ..memory       import MemoryMap
 from ..wishbone     import Interface as WishboneInterface
@@ -25,6 +25,10 @@ class WishboneCSRBridge(Elaboratable):
 	Reads and writes always take ``self.data_width // csr_bus.data_width + 1`` cycles to complete,
 	regardless of the select inputs. Write side effects occur simultaneously with acknowledgement.
 
+	If ``register_strobes`` is set, the CSR bus address, strobes, and write data are registered,
+	which adds one cycle of latency to reads and writes. Write side effects still occur
+	simultaneously with acknowledgement.
+
 	Parameters
 	----------
 	csr_bus : :class:`..csr.Interface`
@@ -33,6 +37,10 @@ class WishboneCSRBridge(Elaboratable):
 		Wishbone bus data width. If not specified, defaults to ``csr_bus.data_width``.
 	name : str
 		Window name. Optional.
+	register_strobes : bool
+		Drive the CSR bus from registers rather than combinationally from the Wishbone bus, cutting
+		the path from Wishbone arbitration and decoding to the CSR registers. Optional, defaults to
+		``False``.
 
 	Attributes
 	----------
@@ -42,7 +50,8 @@ class WishboneCSRBridge(Elaboratable):
 	'''
 
 	def __init__(
-		self, csr_bus: CSRInterface, *, data_width: Optional[int] = None, name: Optional[str] = None
+		self, csr_bus: CSRInterface, *, data_width: Optional[int] = None, name: Optional[str] = None,
+		register_strobes: bool = False
 	) -> None:
 		if not isinstance(csr_bus, CSRInterface):
 			raise ValueError(f'CSR bus must be an instance of CSRInterface, not {csr_bus!r}')
@@ -51,9 +60,19 @@ class WishboneCSRBridge(Elaboratable):
 		if data_width is None:
 			data_width = csr_bus.data_width
 
+		# The Wishbone data is split into segments of the CSR data width, one per select bit, which
+		# are accessed over consecutive CSR addresses.
+		segment_count   = data_width // csr_bus.data_width
+		self._addr_bits = log2_exact(segment_count)
+		self._segments  = tuple(
+			slice(index * csr_bus.data_width, (index + 1) * csr_bus.data_width)
+			for index in range(segment_count)
+		)
+		self._register_strobes = register_strobes
+
 		self.csr_bus = csr_bus
 		self.wb_bus  = WishboneInterface(
-			addr_width = max(0, csr_bus.addr_width - log2_exact(data_width // csr_bus.data_width)),
+			addr_width = max(0, csr_bus.addr_width - self._addr_bits),
 			data_width = data_width,
 			granularity = csr_bus.data_width,
 			name = 'wb'
@@ -73,29 +92,46 @@ class WishboneCSRBridge(Elaboratable):
 		csr_bus = self.csr_bus
 		wb_bus  = self.wb_bus
 
+		sel_len   = len(wb_bus.sel)
+		addr_bits = self._addr_bits
+		segments  = self._segments
+
 		m = Module()
 
-		cycle = Signal(range(len(wb_bus.sel) + 1))
-		m.d.comb += csr_bus.addr.eq(Cat(cycle[:log2_exact(len(wb_bus.sel))], wb_bus.adr))
+		if self._register_strobes:
+			# The CSR bus sees every cycle one cycle late, so the read data of each segment also
+			# arrives one cycle later.
+			strobe_domain = 'sync'
+			read_latency  = 2
+			m.d.sync += csr_bus.r_stb.eq(0)
+			m.d.sync += csr_bus.w_stb.eq(0)
+		else:
+			strobe_domain = 'comb'
+			read_latency  = 1
+
+		last_cycle = sel_len + read_latency - 1
+
+		cycle = Signal(range(last_cycle + 1))
+		m.d[strobe_domain] += csr_bus.addr.eq(Cat(cycle[:addr_bits], wb_bus.adr))
+
+		sel_array   = Array(wb_bus.sel)
+		dat_w_array = Array(wb_bus.dat_w[segment] for segment in segments)
+		dat_r_array = Array(wb_bus.dat_r[segment] for segment in segments)
 
 		with m.If(wb_bus.cyc & wb_bus.stb):
-			with m.Switch(cycle):
-				def segment(index):
-					return slice(index * wb_bus.granularity, (index + 1) * wb_bus.granularity)
-
-				for index, sel_index in enumerate(wb_bus.sel):
-					with m.Case(index):
-						if index > 0:
-							# CSR reads are registered, and we need to re-register them.
-							m.d.sync += wb_bus.dat_r[segment(index - 1)].eq(csr_bus.r_data)
-						m.d.comb += csr_bus.r_stb.eq(sel_index & ~wb_bus.we)
-						m.d.comb += csr_bus.w_data.eq(wb_bus.dat_w[segment(index)])
-						m.d.comb += csr_bus.w_stb.eq(sel_index & wb_bus.we)
-						m.d.sync += cycle.eq(index + 1)
-
-				with m.Default():
-					m.d.sync += wb_bus.dat_r[segment(index)].eq(csr_bus.r_data)
-					m.d.sync += wb_bus.ack.eq(1)
+			with m.If(cycle >= read_latency):
+				# CSR reads are registered, and we need to re-register them.
+				m.d.sync += dat_r_array[cycle - read_latency].eq(csr_bus.r_data)
+
+			with m.If(cycle < sel_len):
+				m.d[strobe_domain] += csr_bus.r_stb.eq(sel_array[cycle] & ~wb_bus.we)
+				m.d[strobe_domain] += csr_bus.w_data.eq(dat_w_array[cycle])
+				m.d[strobe_domain] += csr_bus.w_stb.eq(sel_array[cycle] & wb_bus.we)
+
+			with m.If(cycle != last_cycle):
+				m.d.sync += cycle.eq(cycle + 1)
+			with m.Else():
+				m.d.sync += wb_bus.ack.eq(1)
 
 		with m.If(wb_bus.ack):
 			m.d.sync += cycle.eq(0)
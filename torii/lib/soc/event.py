@@ -1,11 +1,10 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
 
-from collections import OrderedDict
-from enum        import Enum
-from typing      import Generator, Optional
+from enum   import Enum
+from typing import Generator, Optional
 
-from ...         import Elaboratable, Module, Record, Signal
+from ...    import Cat, Elaboratable, Module, Record, Signal
 
 __all__ = (
 	'EventMap',
@@ -80,7 +79,8 @@ class Source(Record):
 		event_map.freeze()
 		self._map = event_map
 
-	# FIXME: get rid of this
+	# Comparing a Record builds an HDL expression, which leaves it unhashable, but event maps key
+	# their sources by identity.
 	__hash__ = object.__hash__
 
 
@@ -94,8 +94,12 @@ class EventMap:
 
 	'''
 	def __init__(self) -> None:
-		self._sources = OrderedDict()
-		self._frozen  = False
+		self._sources: dict[Source, int] = dict()
+		self._frozen = False
+		# Snapshots of the sources taken by `freeze`, only valid once the event map is frozen.
+		self._size: int = 0
+		self._items: tuple[tuple[Source, int], ...] = ()
+		self._by_trigger: dict[Source.Trigger, tuple[tuple[Source, int], ...]] = {}
 
 	@property
 	def size(self) -> int:
@@ -107,6 +111,8 @@ class EventMap:
 		The number of event sources in the map.
 
 		'''
+		if self._frozen:
+			return self._size
 		return len(self._sources)
 
 	def freeze(self) -> None:
@@ -117,7 +123,16 @@ class EventMap:
 
 		'''
 
-		self._frozen = True
+		if self._frozen:
+			return
+
+		self._size       = len(self._sources)
+		self._items      = tuple(self._sources.items())
+		self._by_trigger = {
+			trigger: tuple((src, index) for src, index in self._items if src.trigger == trigger)
+			for trigger in Source.Trigger
+		}
+		self._frozen     = True
 
 	def add(self, src: Source) -> None:
 		'''
@@ -138,8 +153,7 @@ class EventMap:
 			raise ValueError('Event map has been frozen. Cannot add source.')
 		if not isinstance(src, Source):
 			raise TypeError(f'Event source must be an instance of event.Source, not {src!r}')
-		if src not in self._sources:
-			self._sources[src] = self.size
+		self._sources.setdefault(src, len(self._sources))
 
 	def index(self, src: Source) -> int:
 		'''
@@ -174,8 +188,30 @@ class EventMap:
 
 		'''
 
-		for src, index in self._sources.items():
-			yield (src, index)
+		if self._frozen:
+			yield from self._items
+		else:
+			yield from self._sources.items()
+
+	def sources_by_trigger(self, trigger: Source.Trigger) -> tuple[tuple[Source, int], ...]:
+		'''
+		Get the event sources with a given trigger mode.
+
+		Arguments
+		---------
+		trigger : :class:`Source.Trigger`
+			Trigger mode.
+
+		Return value
+		------------
+		A tuple of ``src, index`` tuples, in index order, for each event source using ``trigger``.
+
+		'''
+
+		trigger = Source.Trigger(trigger)
+		if self._frozen:
+			return self._by_trigger[trigger]
+		return tuple((src, index) for src, index in self._sources.items() if src.trigger == trigger)
 
 
 class Monitor(Elaboratable):
@@ -215,24 +251,33 @@ class Monitor(Elaboratable):
 	def elaborate(self, platform) -> Module:
 		m = Module()
 
-		for sub, index in self.src.event_map.sources():
-			if sub.trigger != Source.Trigger.LEVEL:
-				sub_i_r = Signal.like(sub.i, name_suffix = '_r')
-				m.d.sync += sub_i_r.eq(sub.i)
-
-			if sub.trigger == Source.Trigger.LEVEL:
-				m.d.comb += sub.trg.eq(sub.i)
-			elif sub.trigger == Source.Trigger.RISE:
-				m.d.comb += sub.trg.eq(~sub_i_r & sub.i)
-			elif sub.trigger == Source.Trigger.FALL:
-				m.d.comb += sub.trg.eq( sub_i_r & ~sub.i)
-			else:
-				raise ValueError(f'Trigger must be Level, Rise, or Fall, not {sub.trigger!r}') # :nocov:
-
-			with m.If(sub.trg):
-				m.d.sync += self.pending[index].eq(1)
-			with m.Elif(self.clear[index]):
-				m.d.sync += self.pending[index].eq(0)
+		event_map  = self.src.event_map
+		level_srcs = [sub for sub, _ in event_map.sources_by_trigger(Source.Trigger.LEVEL)]
+		rise_srcs  = [sub for sub, _ in event_map.sources_by_trigger(Source.Trigger.RISE)]
+		fall_srcs  = [sub for sub, _ in event_map.sources_by_trigger(Source.Trigger.FALL)]
+
+		if level_srcs:
+			m.d.comb += Cat(*(sub.trg for sub in level_srcs)).eq(Cat(*(sub.i for sub in level_srcs)))
+
+		# Register the inputs of all edge-triggered sources together, rising ones first.
+		edge_srcs = rise_srcs + fall_srcs
+		if edge_srcs:
+			edge_i_r = Signal(len(edge_srcs), name = 'sub_i_r')
+			m.d.sync += edge_i_r.eq(Cat(*(sub.i for sub in edge_srcs)))
+
+		if rise_srcs:
+			rise_i   = Cat(*(sub.i for sub in rise_srcs))
+			rise_i_r = edge_i_r[:len(rise_srcs)]
+			m.d.comb += Cat(*(sub.trg for sub in rise_srcs)).eq(~rise_i_r & rise_i)
+
+		if fall_srcs:
+			fall_i   = Cat(*(sub.i for sub in fall_srcs))
+			fall_i_r = edge_i_r[len(rise_srcs):]
+			m.d.comb += Cat(*(sub.trg for sub in fall_srcs)).eq( fall_i_r & ~fall_i)
+
+		# Sources are indexed in order, and a new event takes priority over clearing it.
+		trg = Cat(*(sub.trg for sub, _ in event_map.sources()))
+		m.d.sync += self.pending.eq(self.pending & ~self.clear | trg)
 
 		m.d.comb += self.src.i.eq((self.enable & self.pending).any())
 
@@ -19,43 +19,53 @@ class _RangeMap:
 	'''
 
 	def __init__(self) -> None:
-		self._keys   = []
-		self._values = dict()
-		self._starts = []
-		self._stops  = []
+		# The ranges are stored column-wise, sorted by address, rather than as range objects.
+		self._starts: list[int]    = []
+		self._stops:  list[int]    = []
+		self._steps:  list[int]    = []
+		self._values: list[object] = []
+		# The ``(start, stop, value)`` of the last range found by get(), as lookups tend to hit
+		# the same range repeatedly. Ranges are never removed or resized, so it never goes stale.
+		self._last: Optional[tuple[int, int, object]] = None
 
 	def insert(self, key: range, value: object):
 		if not isinstance(key, range):
 			raise TypeError(f'key must be of type \'range\', not \'{type(key)}\'')
 
-		if self.overlaps(key):
-			raise ValueError(f'Key {key} overlaps an existing region!')
-
-		start_idx = bisect_right(self._starts, key.start)
-		stop_idx  = bisect_left(self._stops, key.stop)
+		# Every range before start_idx ends at or before the start of the key, and every range from
+		# stop_idx onwards starts at or after its end. Any range in between overlaps the key.
+		start_idx = bisect_right(self._stops, key.start)
+		stop_idx  = bisect_left(self._starts, key.stop)
 		if start_idx != stop_idx:
-			raise ValueError(f'Start and stop indices are not equivalent: {start_idx} != {stop_idx}')
+			raise ValueError(f'Key {key} overlaps an existing region!')
 
 		self._starts.insert(start_idx, key.start)
-		self._stops.insert(stop_idx, key.stop)
-		self._keys.insert(start_idx, key)
-		self._values[key] = value
+		self._stops.insert(start_idx, key.stop)
+		self._steps.insert(start_idx, key.step)
+		self._values.insert(start_idx, value)
 
 	def get(self, point: int) -> object:
+		last = self._last
+		if last is not None and last[0] <= point < last[1]:
+			return last[2]
+
 		point_idx = bisect_right(self._stops, point)
-		if point_idx < len(self._keys):
-			point_range = self._keys[point_idx]
-			if point >= point_range.start and point < point_range.stop:
-				return self._values[point_range]
+		if point_idx < len(self._starts) and self._starts[point_idx] <= point:
+			value      = self._values[point_idx]
+			self._last = (self._starts[point_idx], self._stops[point_idx], value)
+			return value
 
-	def overlaps(self, key: range) -> list[object]:
+	def overlaps(self, key: range) -> bool:
+		return bisect_right(self._stops, key.start) != bisect_left(self._starts, key.stop)
+
+	def overlap_values(self, key: range) -> list[object]:
 		start_idx = bisect_right(self._stops, key.start)
 		stop_idx  = bisect_left(self._starts, key.stop)
-		return [self._values[key] for key in self._keys[start_idx:stop_idx]]
+		return self._values[start_idx:stop_idx]
 
 	def items(self) -> Generator[tuple[range, object], None, None]:
-		for key in self._keys:
-			yield (key, self._values[key])
+		for start, stop, step, value in zip(self._starts, self._stops, self._steps, self._values):
+			yield (range(start, stop, step), value)
 
 
 class ResourceInfo:
@@ -83,6 +93,8 @@ class ResourceInfo:
 
 	'''
 
+	__slots__ = ('_resource', '_name', '_start', '_end', '_width')
+
 	def __init__(
 		self, resource: object, name: Union[str, Iterable[str]], start: int, end: int, width: int
 	) -> None:
@@ -103,6 +115,26 @@ class ResourceInfo:
 		self._end      = end
 		self._width    = width
 
+	@classmethod
+	def _unchecked(
+		cls, resource: object, name: tuple[str, ...], start: int, end: int, width: int
+	) -> 'ResourceInfo':
+		'''
+		Construct resource metadata without validating it.
+
+		Only for use by :class:`MemoryMap`, whose resources and windows were already validated when
+		they were added. ``name`` must be a tuple.
+
+		'''
+
+		self = cls.__new__(cls)
+		self._resource = resource
+		self._name     = name
+		self._start    = start
+		self._end      = end
+		self._width    = width
+		return self
+
 	@property
 	def resource(self) -> object:
 		return self._resource
@@ -182,6 +214,12 @@ class MemoryMap:
 		self._next_addr  = 0
 		self._frozen     = False
 
+		# Once frozen, the resources behind this memory map cannot change anymore, so address
+		# translation results are kept around.
+		self._resource_infos:  Optional[tuple[ResourceInfo, ...]]                    = None
+		self._found_resources: dict[int, ResourceInfo]                               = dict()
+		self._window_patterns: Optional[tuple[tuple[object, tuple[str, int]], ...]] = None
+
 	@property
 	def addr_width(self) -> int:
 		return self._addr_width
@@ -216,7 +254,8 @@ class MemoryMap:
 		Freeze the memory map.
 
 		Once the memory map is frozen, its visible state becomes immutable. Resources and windows
-		cannot be added anymore, and its address width cannot be extended further.
+		cannot be added anymore, and its address width cannot be extended further. The results of
+		:meth:`all_resources`, :meth:`find_resource` and :meth:`window_patterns` are then cached.
 
 		'''
 
@@ -224,9 +263,8 @@ class MemoryMap:
 
 	@staticmethod
 	def _align_up(value: int, alignment: int) -> int:
-		if value % (1 << alignment) != 0:
-			value += (1 << alignment) - (value % (1 << alignment))
-		return value
+		mask = (1 << alignment) - 1
+		return (value + mask) & ~mask
 
 	def align_to(self, alignment: int) -> int:
 		'''
@@ -252,39 +290,45 @@ class MemoryMap:
 	def _compute_addr_range(
 		self, addr: int, size: int, step: int = 1, *, alignment: int, extend: bool
 	) -> range:
+		align_mask = (1 << alignment) - 1
 		if addr is not None:
 			if not isinstance(addr, int) or addr < 0:
 				raise ValueError(f'Address must be a non-negative integer, not {addr!r}')
 			if addr % (1 << self.alignment) != 0:
 				raise ValueError(f'Explicitly specified address {addr:#x} must be a multiple of {1 << alignment:#x} bytes')
 		else:
-			addr = self._align_up(self._next_addr, alignment)
+			# Sequential insertions with the same alignment leave the next address aligned already.
+			addr = self._next_addr
+			if addr & align_mask:
+				addr = (addr + align_mask) & ~align_mask
 
 		if not isinstance(size, int) or size < 0:
 			raise ValueError(f'Size must be a non-negative integer, not {size!r}')
-		size = self._align_up(max(size, 1), alignment)
+		size = (max(size, 1) + align_mask) & ~align_mask
+		stop = addr + size
 
-		if addr > (1 << self.addr_width) or addr + size > (1 << self.addr_width):
+		# The size is at least 1, so the range ending out of bounds covers it starting out of bounds.
+		addr_space = 1 << self.addr_width
+		if stop > addr_space:
 			if extend:
-				self.addr_width = bits_for(addr + size)
+				self.addr_width = bits_for(stop)
 			else:
 				raise ValueError(
-					f'Address range {addr:#x}..{addr + size:#x} out of bounds for memory map spanning '
-					f'range {0:#x}..{1 << self.addr_width:#x} ({self.addr_width} address bits)'
+					f'Address range {addr:#x}..{stop:#x} out of bounds for memory map spanning '
+					f'range {0:#x}..{addr_space:#x} ({self.addr_width} address bits)'
 				)
 
-		addr_range = range(addr, addr + size, step)
-		overlaps = self._ranges.overlaps(addr_range)
-		if overlaps:
+		addr_range = range(addr, stop, step)
+		if self._ranges.overlaps(addr_range):
 			overlap_descrs = []
-			for overlap in overlaps:
+			for overlap in self._ranges.overlap_values(addr_range):
 				if id(overlap) in self._resources:
 					_, _, resource_range = self._resources[id(overlap)]
 					overlap_descrs.append(f'resource {overlap!r} at {resource_range.start:#x}..{resource_range.stop:#x}')
 				if id(overlap) in self._windows:
 					_, window_range = self._windows[id(overlap)]
 					overlap_descrs.append(f'window {overlap!r} at {window_range.start:#x}..{ window_range.stop:#x}')
-			raise ValueError(f'Address range {addr:#x}..{addr + size:#x} overlaps with {", ".join(overlap_descrs)}')
+			raise ValueError(f'Address range {addr:#x}..{stop:#x} overlaps with {", ".join(overlap_descrs)}')
 
 		return addr_range
 
@@ -470,7 +514,9 @@ class MemoryMap:
 				)
 
 		if window.name is None:
-			name_conflicts = sorted(self._namespace.keys() & window._namespace.keys())
+			# Only walk the names of the window, intersecting the key views would also copy every
+			# name of this memory map into a temporary set.
+			name_conflicts = sorted(name for name in window._namespace if name in self._namespace)
 			if name_conflicts:
 				name_conflict_descrs = [
 					f'{name} is used by {self._namespace[name]!r}' for name in name_conflicts
@@ -540,19 +586,35 @@ class MemoryMap:
 
 		'''
 
-		for window, window_range in self._windows.values():
-			const_bits = self.addr_width - window.addr_width
-			if const_bits > 0:
-				const_pat = f'{window_range.start >> window.addr_width:0{const_bits}b}'
-			else:
-				const_pat = ''
-			pattern = f'{const_pat}{"-" * window.addr_width}'
-			yield (window, (pattern, window_range.step))
+		window_patterns = self._window_patterns
+		if window_patterns is None:
+			patterns = []
+			for window, window_range in self._windows.values():
+				const_bits = self.addr_width - window.addr_width
+				if const_bits > 0:
+					const_pat = f'{window_range.start >> window.addr_width:0{const_bits}b}'
+				else:
+					const_pat = ''
+				pattern = f'{const_pat}{"-" * window.addr_width}'
+				patterns.append((window, (pattern, window_range.step)))
+			window_patterns = tuple(patterns)
+			if self._frozen:
+				self._window_patterns = window_patterns
+
+		yield from window_patterns
 
 	@staticmethod
 	def _translate(
 		resource_info: ResourceInfo, window, window_range: range
 	) -> ResourceInfo:
+		# Unnamed dense windows only offset the address range, and the checks below trivially hold.
+		if window_range.step == 1 and window.name is None:
+			offset = window_range.start
+			return ResourceInfo._unchecked(
+				resource_info.resource, resource_info.name, resource_info.start + offset,
+				resource_info.end + offset, resource_info.width
+			)
+
 		if (resource_info.end - resource_info.start) % window_range.step != 0:
 			raise ValueError('Resource range does not fit in the window range step')
 
@@ -567,7 +629,7 @@ class MemoryMap:
 		size  = (resource_info.end - resource_info.start) // window_range.step
 		start = resource_info.start + window_range.start
 		width = resource_info.width * window_range.step
-		return ResourceInfo(resource_info.resource, name, start, start + size, width)
+		return ResourceInfo._unchecked(resource_info.resource, name, start, start + size, width)
 
 	def all_resources(self) -> Generator[ResourceInfo, None, None]:
 		'''
@@ -582,13 +644,27 @@ class MemoryMap:
 
 		'''
 
+		if not self._frozen:
+			yield from self._all_resources()
+			return
+
+		resource_infos = self._resource_infos
+		if resource_infos is None:
+			self._resource_infos = resource_infos = tuple(self._all_resources())
+		yield from resource_infos
+
+	def _all_resources(self) -> Generator[ResourceInfo, None, None]:
+		data_width = self.data_width
+		resources  = self._resources
+		windows    = self._windows
 		for addr_range, assignment in self._ranges.items():
-			if id(assignment) in self._resources:
-				_, resource_name, _ = self._resources[id(assignment)]
-				yield ResourceInfo(
-					assignment, resource_name, addr_range.start, addr_range.stop, self.data_width
+			entry = resources.get(id(assignment))
+			if entry is not None:
+				_, resource_name, _ = entry
+				yield ResourceInfo._unchecked(
+					assignment, (resource_name,), addr_range.start, addr_range.stop, data_width
 				)
-			elif id(assignment) in self._windows:
+			elif id(assignment) in windows:
 				for resource_info in assignment.all_resources():
 					yield self._translate(resource_info, assignment, addr_range)
 			else:
@@ -616,10 +692,22 @@ class MemoryMap:
 
 		'''
 
-		if id(resource) in self._resources:
-			_, resource_name, resource_range = self._resources[id(resource)]
-			return ResourceInfo(resource, resource_name, resource_range.start, resource_range.stop,
-								self.data_width)
+		if not self._frozen:
+			return self._find_resource(resource)
+
+		resource_info = self._found_resources.get(id(resource))
+		if resource_info is None:
+			resource_info = self._find_resource(resource)
+			self._found_resources[id(resource)] = resource_info
+		return resource_info
+
+	def _find_resource(self, resource: object) -> ResourceInfo:
+		resource_entry = self._resources.get(id(resource))
+		if resource_entry is not None:
+			_, resource_name, resource_range = resource_entry
+			return ResourceInfo._unchecked(
+				resource, (resource_name,), resource_range.start, resource_range.stop, self.data_width
+			)
 
 		for window, window_range in self._windows.values():
 			try:
@@ -644,14 +732,20 @@ class MemoryMap:
 
 		'''
 
-		assignment = self._ranges.get(address)
-		if assignment is None:
-			return
+		# Descend through the windows in a loop rather than by recursion.
+		memory_map = self
+		while True:
+			assignment = memory_map._ranges.get(address)
+			if assignment is None:
+				return None
 
-		if id(assignment) in self._resources:
-			return assignment
-		elif id(assignment) in self._windows:
-			_, addr_range = self._windows[id(assignment)]
-			return assignment.decode_address((address - addr_range.start) // addr_range.step)
-		else:
-			raise ValueError(f'Address {address} is not a known resource or in a valid address window') # :nocov:
+			if id(assignment) in memory_map._resources:
+				return assignment
+
+			window_entry = memory_map._windows.get(id(assignment))
+			if window_entry is None:
+				raise ValueError(f'Address {address} is not a known resource or in a valid address window') # :nocov:
+
+			window, addr_range = window_entry
+			address    = (address - addr_range.start) // addr_range.step
+			memory_map = window
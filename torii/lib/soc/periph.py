@@ -1,8 +1,7 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
-from collections     import OrderedDict
 from collections.abc import Mapping
-from typing          import Generator, Optional
+from typing          import Iterator, Optional
 
 from ...util.units   import bits_for
 from .               import event
@@ -18,7 +17,7 @@ __all__ = (
 
 
 class ConstantValue:
-	pass
+	__slots__ = ()
 
 
 class ConstantBool(ConstantValue):
@@ -32,10 +31,24 @@ class ConstantBool(ConstantValue):
 
 	'''
 
-	def __init__(self, value: bool) -> None:
+	__slots__ = ('_value',)
+	_value: bool
+
+	# There are only two possible boolean constants, so share them instead of allocating new ones.
+	_instances: dict[tuple[type, bool], 'ConstantBool'] = {}
+
+	def __new__(cls, value: bool) -> 'ConstantBool':
 		if not isinstance(value, bool):
 			raise TypeError(f'Value must be a bool, not {value!r}')
-		self._value = value
+		self = cls._instances.get((cls, value))
+		if self is None:
+			self = super().__new__(cls)
+			self._value = value
+			cls._instances[(cls, value)] = self
+		return self
+
+	def __reduce__(self):
+		return (type(self), (self._value,))
 
 	@property
 	def value(self) -> bool:
@@ -60,6 +73,8 @@ class ConstantInt(ConstantValue):
 
 	'''
 
+	__slots__ = ('_value', '_width', '_signed')
+
 	def __init__(
 		self, value: int, *, width: Optional[int] = None, signed: Optional[bool] = None
 	) -> None:
@@ -67,11 +82,12 @@ class ConstantInt(ConstantValue):
 			raise TypeError(f'Value must be an integer, not {value!r}')
 		self._value = value
 
+		min_width = bits_for(value)
 		if width is None:
-			width = bits_for(value)
+			width = min_width
 		if not isinstance(width, int):
 			raise TypeError(f'Width must be an integer, not {width!r}')
-		if width < bits_for(value):
+		if width < min_width:
 			raise ValueError(f'Width must be greater than or equal to the number of bits needed to represent {value}')
 		self._width = width
 
@@ -115,22 +131,31 @@ class ConstantMap(Mapping):
 
 	'''
 
+	__slots__ = ('_storage',)
+
+	_WRAPPERS = {
+		bool: ConstantBool,
+		int:  ConstantInt,
+	}
+
 	def __init__(self, **constants: dict[str, ConstantValue]) -> None:
-		self._storage = OrderedDict()
+		self._storage = {}
 		for key, value in constants.items():
-			if isinstance(value, bool):
-				value = ConstantBool(value)
-			if isinstance(value, int):
+			wrapper = self._WRAPPERS.get(type(value))
+			if wrapper is not None:
+				value = wrapper(value)
+			elif isinstance(value, int):
+				# Subclasses of int such as `enum.IntEnum` members
 				value = ConstantInt(value)
-			if not isinstance(value, ConstantValue):
+			elif not isinstance(value, ConstantValue):
 				raise TypeError(f'Constant value must be an instance of ConstantValue, not {value!r}')
 			self._storage[key] = value
 
 	def __getitem__(self, key) -> ConstantValue:
 		return self._storage[key]
 
-	def __iter__(self) -> Generator[ConstantValue, None, None]:
-		yield from self._storage
+	def __iter__(self) -> Iterator[str]:
+		return iter(self._storage)
 
 	def __len__(self) -> int:
 		return len(self._storage)
@@ -139,6 +164,10 @@ class ConstantMap(Mapping):
 		return f'ConstantMap({list(self._storage.items())})'
 
 
+# ConstantMap is read-only, so peripherals without constants can all share the same empty map
+_EMPTY_CONSTANT_MAP = ConstantMap()
+
+
 class PeripheralInfo:
 	'''
 	Peripheral metadata.
@@ -157,6 +186,8 @@ class PeripheralInfo:
 
 	'''
 
+	__slots__ = ('_memory_map', '_irq', '_constant_map')
+
 	def __init__(
 		self, *, memory_map: MemoryMap, irq: Optional[event.Source] = None,
 		constant_map: Optional[ConstantMap] = None
@@ -171,7 +202,7 @@ class PeripheralInfo:
 		self._irq = irq
 
 		if constant_map is None:
-			constant_map = ConstantMap()
+			constant_map = _EMPTY_CONSTANT_MAP
 		if not isinstance(constant_map, ConstantMap):
 			raise TypeError(f'Constant map must be an instance of ConstantMap, not {constant_map!r}')
 		self._constant_map = constant_map
@@ -1,8 +1,10 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
+from functools     import lru_cache
 from typing        import Literal, Optional, Union
 
 from ...           import Cat, Const, Elaboratable, Module, Record, Signal
+from ...hdl.rec    import Layout
 from ...util.units import bits_for
 from ..cdc         import FFSynchronizer
 from ..io          import Pin
@@ -19,18 +21,19 @@ def _check_divisor(divisor: int, bound: int):
 		raise ValueError(f'Invalid divisor {divisor!r}; must be greater than or equal to {bound}')
 
 
+_PARITY_CHOICES = ( 'none', 'mark', 'space', 'even', 'odd' )
+_PARITY_SET     = frozenset(_PARITY_CHOICES)
+
+
 def _check_parity(parity: Literal['none', 'mark', 'space', 'even', 'odd']):
-	choices = ( 'none', 'mark', 'space', 'even', 'odd' )
-	if parity not in choices:
-		raise ValueError(f'Invalid parity {parity!r}; must be one of {", ".join(choices)}')
+	if parity not in _PARITY_SET:
+		raise ValueError(f'Invalid parity {parity!r}; must be one of {", ".join(_PARITY_CHOICES)}')
 
 
 def _compute_parity_bit(
 	data: Record , parity: Literal['none', 'mark', 'space', 'even', 'odd']
 ) -> Union[Const, Record, bool]:
-	if parity not in ('none', 'mark', 'space', 'even', 'odd'):
-		raise ValueError(f'Parity must be one of \'none\', \'mark\', \'space\', \'even\', or \'odd\', not \'{parity}\'')
-
+	# The parity mode has already been validated by `_check_parity` when the transceiver was constructed
 	if parity == 'none':
 		return Const(0, 0)
 	if parity == 'mark':
@@ -43,15 +46,16 @@ def _compute_parity_bit(
 		return ~data.xor()
 
 
+@lru_cache(maxsize = None)
 def _wire_layout(
 	data_bits: int, parity: Literal['none', 'mark', 'space', 'even', 'odd'] = 'none'
-) -> list[tuple[str, int]]:
-	return [
+) -> tuple[tuple[str, int], ...]:
+	return (
 		('start',  1),
 		('data',   data_bits),
 		('parity', 0 if parity == 'none' else 1),
 		('stop',   1),
-	]
+	)
 
 
 class AsyncSerialRX(Elaboratable):
@@ -117,12 +121,13 @@ class AsyncSerialRX(Elaboratable):
 		self.i    = Signal(reset = 1)
 
 		self._pins = pins
+		self._shreg_layout = Layout.cast(_wire_layout(data_bits, parity))
 
 	def elaborate(self, platform) -> Module:
 		m = Module()
 
 		timer = Signal.like(self.divisor)
-		shreg = Record(_wire_layout(len(self.data), self._parity))
+		shreg = Record(self._shreg_layout)
 		bitno = Signal(range(len(shreg)))
 
 		if self._pins is not None:
@@ -217,12 +222,13 @@ class AsyncSerialTX(Elaboratable):
 		self.o    = Signal(reset = 1)
 
 		self._pins = pins
+		self._shreg_layout = Layout.cast(_wire_layout(data_bits, parity))
 
 	def elaborate(self, platform) -> Module:
 		m = Module()
 
 		timer = Signal.like(self.divisor)
-		shreg = Record(_wire_layout(len(self.data), self._parity))
+		shreg = Record(self._shreg_layout)
 		bitno = Signal(range(len(shreg)))
 
 		if self._pins is not None: